@@ -1,13 +1,42 @@
 from mcp.server.fastmcp import FastMCP
+import asyncio
+import functools
+import heapq
+import itertools
 import os
-from typing import Dict, List, Any, Optional
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Any,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+import httpx
+import uvicorn
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from postgrest import APIError
+from supabase import create_client, Client, ClientOptions
 
 load_dotenv()
 
 port = int(os.getenv("PORT"))
 table_name = os.getenv("TABLE_NAME")
+# Optional view with a truncated thesis (see sql/investor_functions.sql) that the
+# list tools read from to move fewer bytes
+compact_table_name = os.getenv("COMPACT_TABLE_NAME") or table_name
+cache_ttl_seconds = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+db_threads = int(os.getenv("DB_THREADS", "32"))
+workers = int(os.getenv("WORKERS", "1"))
 
 mcp = FastMCP(
     name="VC Data Server",
@@ -16,12 +45,376 @@ mcp = FastMCP(
     stateless_http=True,
 )
 
+# Postgres functions (see sql/investor_functions.sql) found to be missing
+_UNAVAILABLE_FUNCTIONS: set[str] = set()
+
+# Static guide returned by get_location_search_guide
+_LOCATION_GUIDE = """
+    Location Search Guide:
+    
+    There are two different ways to search for investors by location:
+    
+    1. COUNTRY OF INVESTMENT (country parameter):
+       - Uses country codes like "USA", "UK", "Germany"
+       - Shows where the investor makes investments
+       - Example: "Find VCs in USA" or "Angel investors in UK"
+    
+    2. GLOBAL HQ LOCATION (hq_location parameter):
+       - Uses full addresses like "San Francisco, CA" or "New York, NY"
+       - Shows where the investor's headquarters is located
+       - Example: "Investors headquartered in San Francisco" or "VCs in New York"
+    
+    Tips:
+    - Use "country" for broad geographic investment areas
+    - Use "hq_location" for specific city/state searches
+    - You can search for cities, states, or countries in HQ location
+    - Country searches are more precise, HQ searches are more flexible
+    """
+
+# Multipliers for amount suffixes like "100k" or "1M"
+_AMOUNT_SUFFIXES = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+# Line printed after each investor record in list responses
+_RECORD_SEPARATOR = "-" * 80 + "\n\n"
+
+# Columns shown for each investor in list responses
+_INVESTOR_LIST_COLUMNS = [
+    "Investor name",
+    "Website",
+    "Global HQ",
+    "Countries of investment",
+    "Stage of investment",
+    "Investment thesis",
+    "Investor type",
+    "First cheque minimum",
+    "First cheque maximum",
+]
+
+# Factors find_similar_investors compares with the target investor, and
+# their weights in the similarity score
+_SIMILARITY_FACTORS = (
+    ("same investor type", 3),
+    ("same investment stage", 2),
+    ("shared investment countries", 2),
+    ("similar HQ location", 1),
+)
+
+# Sort key for every row query. Postgres returns rows in no particular order,
+# and separately requested pages can repeat or skip rows unless each page is
+# cut from the same ordering. The OpenVC table has no id column; an investor's
+# name, website and HQ together identify it.
+_ROW_ORDER_COLUMNS = ("Investor name", "Website", "Global HQ")
+
+# Columns whose few distinct values repeat across thousands of investors
+_CATEGORICAL_COLUMNS = (
+    "Investor type",
+    "Stage of investment",
+    "Countries of investment",
+    "Global HQ",
+)
+
+# Common investor type names mapped to database values
+_INVESTOR_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "angel": "Angel network",
+        "angel network": "Angel network",
+        "vc": "VC",
+        "venture capital": "VC",
+        "pe": "PE",
+        "private equity": "PE",
+        "cvc": "CVC",
+        "corporate venture capital": "CVC",
+    }
+)
+
+# Common country names mapped to database values
+_COUNTRY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "united states": "USA",
+        "usa": "USA",
+        "us": "USA",
+        "america": "USA",
+        "united kingdom": "UK",
+        "uk": "UK",
+        "england": "UK",
+        "great britain": "UK",
+        "germany": "Germany",
+        "france": "France",
+        "canada": "Canada",
+        "australia": "Australia",
+        "japan": "Japan",
+        "china": "China",
+        "india": "India",
+        "singapore": "Singapore",
+        "netherlands": "Netherlands",
+        "sweden": "Sweden",
+        "switzerland": "Switzerland",
+        "israel": "Israel",
+    }
+)
+
+# Investment thesis themes and the keywords that count towards each
+_THESIS_THEMES = {
+    "AI": ["AI", "artificial intelligence"],
+    "machine learning": ["machine learning", "ML"],
+    "fintech": ["fintech", "financial technology"],
+    "healthcare": ["healthtech", "healthcare"],
+    "SaaS": ["SaaS"],
+    "software": ["software"],
+    "enterprise": ["enterprise"],
+    "B2B": ["B2B"],
+    "B2C": ["B2C"],
+    "ecommerce": ["ecommerce", "e-commerce"],
+    "marketplace": ["marketplace"],
+    "platform": ["platform"],
+    "mobile": ["mobile"],
+    "biotech": ["biotech", "biotechnology"],
+    "clean energy": ["clean energy"],
+    "sustainability": ["sustainability"],
+    "cybersecurity": ["cybersecurity", "security"],
+    "blockchain": ["blockchain", "crypto", "cryptocurrency"],
+    "edtech": ["edtech", "education"],
+    "real estate": ["real estate", "proptech"],
+}
+_THESIS_KEYWORD_THEMES = {
+    keyword.lower(): theme
+    for theme, keywords in _THESIS_THEMES.items()
+    for keyword in keywords
+}
+# Whole-word match of any keyword (optionally plural), longest keywords first
+_THESIS_PATTERN = re.compile(
+    r"\b("
+    + "|".join(
+        re.escape(keyword)
+        for keyword in sorted(_THESIS_KEYWORD_THEMES, key=len, reverse=True)
+    )
+    + r")s?\b",
+    re.IGNORECASE,
+)
+# Words for the thesis search fallback. "*" separates words like whitespace
+# does, as in full-text search, since PostgREST would read it as a wildcard.
+_THESIS_WORD_PATTERN = re.compile(r"[^\s*]+")
+
+# Cached tool responses: key -> (time computed, response)
+_cache: Dict[str, tuple[float, str]] = {}
+
+
+class _InvestorTable(NamedTuple):
+    """In-memory copy of the investor table with indexes for similarity scoring."""
+
+    rows: List[Dict[str, Any]]
+    # Investor name -> positions in rows of the investors with that name
+    by_name: Dict[Any, List[int]]
+    # Column value -> positions in rows of the investors with that value
+    by_type: Dict[Any, set[int]]
+    by_stage: Dict[Any, set[int]]
+    by_countries: Dict[Any, set[int]]
+    by_hq: Dict[str, set[int]]
+    # Single country -> positions of the investors that list it
+    by_country: Dict[str, set[int]]
+    # Target HQ -> positions of the investors with a similar HQ, filled in as
+    # targets are looked up
+    similar_hq: Dict[str, set[int]]
+    # (minimum, maximum, record) for the investors with parseable cheque sizes
+    cheques: List[tuple[int, int, Dict[str, Any]]]
+    # Distributions served by the analysis tools' Python fallbacks
+    type_counts: Counter
+    stage_counts: Counter
+    country_counts: Counter
+    # Number of investors with both cheque sizes filled in
+    cheque_coverage: int
+
+
+# In-memory copy of the investor table for the tools that scan every row:
+# (time loaded, table)
+_investor_snapshot: Optional[tuple[float, _InvestorTable]] = None
+_INVESTOR_SNAPSHOT_LOCK = threading.Lock()
+
+# When the cached similar investor responses started: a reload of the investor
+# table restarts them. It is part of the cache key, so a response finished
+# from the previous snapshot after a reload is never served.
+_similar_reports_started = 0.0
+
+# Threads that run the blocking Supabase calls, sized for the database rather
+# than asyncio's small default executor
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=db_threads, thread_name_prefix="supabase")
+
+# Shared Supabase client, created lazily on first use
+_SUPABASE_CLIENT: Optional[Client] = None
+_SUPABASE_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> Client:
+    """
+    Get the shared Supabase client, creating it on first use.
+
+    The client (and its pooled HTTP connections) is reused across tool calls
+    so each request doesn't pay for connection and TLS setup.
+
+    Returns:
+        Client: The shared Supabase client
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+    """
+    global _SUPABASE_CLIENT
+
+    if _SUPABASE_CLIENT is not None:
+        return _SUPABASE_CLIENT
+
+    with _SUPABASE_CLIENT_LOCK:
+        if _SUPABASE_CLIENT is None:
+            # Get Supabase credentials from environment variables
+            supabase_url = os.getenv("SUPABASE_URL")
+            supabase_key = os.getenv("SUPABASE_KEY")
+
+            if not supabase_url or not supabase_key:
+                raise ValueError(
+                    "Supabase credentials not found. Please set SUPABASE_URL and SUPABASE_KEY "
+                    "environment variables or add them to your .env file."
+                )
+
+            http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=30,
+                follow_redirects=True,
+                http2=True,
+            )
+            _SUPABASE_CLIENT = create_client(
+                supabase_url,
+                supabase_key,
+                options=ClientOptions(httpx_client=http_client),
+            )
+
+    return _SUPABASE_CLIENT
+
+
+async def _run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function on the database thread pool and await its result.
+
+    supabase-py makes synchronous HTTP requests, so calling it directly from a
+    tool handler would block the event loop for the whole round trip.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _DB_EXECUTOR, functools.partial(fn, *args, **kwargs)
+    )
+
+
+def _build_select_query(
+    supabase: Client,
+    table_name: str,
+    select_columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    ilike_filters: Optional[Dict[str, List[str]]] = None,
+    count_only: bool = False,
+):
+    """
+    Build a select query with the given columns and filters.
+
+    A fresh query is needed for every page since the query builder accumulates
+    its parameters. Rows are sorted by _ROW_ORDER_COLUMNS so page ranges cut a
+    single stable ordering. With count_only, the query returns the exact number
+    of matching rows and no row data.
+    """
+    if count_only:
+        query = supabase.table(table_name).select("*", count="exact", head=True)
+    elif select_columns is None:
+        query = supabase.table(table_name).select("*")
+    else:
+        # Handle column names with spaces by wrapping them in quotes
+        quoted_columns = [f'"{col}"' for col in select_columns]
+        query = supabase.table(table_name).select(", ".join(quoted_columns))
+
+    # Apply filters if provided. Unlike select, filter column names must not be
+    # quoted: PostgREST takes them as the bare query parameter name.
+    if filters:
+        for column, value in filters.items():
+            query = query.eq(column, value)
+
+    # Apply case-insensitive substring filters if provided. The texts are
+    # matched literally, so LIKE wildcards in them are escaped. PostgREST
+    # also reads "*" as "%" and offers no way to escape it, so it is refused.
+    if ilike_filters:
+        for column, texts in ilike_filters.items():
+            for text in texts:
+                if "*" in text:
+                    raise ValueError(
+                        f"Substring filter on {column} cannot contain '*': {text}"
+                    )
+                escaped = (
+                    text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                )
+                query = query.ilike(column, f"%{escaped}%")
+
+    if not count_only:
+        # Like select, order needs column names with spaces quoted
+        for column in _ROW_ORDER_COLUMNS:
+            query = query.order(f'"{column}"')
+
+    return query
+
+
+def iter_rows_from_supabase(
+    table_name: str,
+    select_columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None,
+    page_size: int = 1000,
+    ilike_filters: Optional[Dict[str, List[str]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows from OpenVC database one page at a time.
+
+    Pages are requested with explicit ranges, and each request starts where
+    the previous one ended, so results are not silently cut off at PostgREST's
+    maximum row count and only one page is held in memory.
+
+    Args:
+        table_name (str): Name of the table to fetch data from
+        select_columns (Optional[List[str]]): List of columns to select. If None, selects all columns
+        filters (Optional[Dict[str, Any]]): Dictionary of filters to apply (column: value)
+        limit (Optional[int]): Maximum number of records to return. If None, streams all records
+        page_size (int): Number of records to request per page
+        ilike_filters (Optional[Dict[str, List[str]]]): Dictionary of case-insensitive substring filters (column: texts that must all appear)
+
+    Yields:
+        Dict[str, Any]: Records from the table
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error connecting to Supabase or fetching data
+    """
+    supabase = _get_client()
+
+    start = 0
+    while limit is None or start < limit:
+        size = page_size if limit is None else min(page_size, limit - start)
+
+        try:
+            query = _build_select_query(
+                supabase, table_name, select_columns, filters, ilike_filters
+            )
+            response = query.range(start, start + size - 1).execute()
+
+        except Exception as e:
+            raise Exception(f"Error fetching data from Supabase: {str(e)}")
+
+        # The server may return fewer rows than requested, so only an empty
+        # page means there are no more rows
+        if not response.data:
+            break
+        yield from response.data
+        start += len(response.data)
+
 
 def fetch_data_from_supabase(
     table_name: str,
     select_columns: Optional[List[str]] = None,
     filters: Optional[Dict[str, Any]] = None,
     limit: Optional[int] = None,
+    ilike_filters: Optional[Dict[str, List[str]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Fetch data from OpenVC database.
@@ -31,6 +424,7 @@ def fetch_data_from_supabase(
         select_columns (Optional[List[str]]): List of columns to select. If None, selects all columns
         filters (Optional[Dict[str, Any]]): Dictionary of filters to apply (column: value)
         limit (Optional[int]): Maximum number of records to return
+        ilike_filters (Optional[Dict[str, List[str]]]): Dictionary of case-insensitive substring filters (column: texts that must all appear)
 
     Returns:
         List[Dict[str, Any]]: List of records from the table
@@ -39,47 +433,620 @@ def fetch_data_from_supabase(
         ValueError: If Supabase credentials are not configured
         Exception: If there's an error connecting to Supabase or fetching data
     """
-    # Get Supabase credentials from environment variables
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_KEY")
+    return list(
+        iter_rows_from_supabase(
+            table_name=table_name,
+            select_columns=select_columns,
+            filters=filters,
+            limit=limit,
+            ilike_filters=ilike_filters,
+        )
+    )
+
 
-    if not supabase_url or not supabase_key:
-        raise ValueError(
-            "Supabase credentials not found. Please set SUPABASE_URL and SUPABASE_KEY "
-            "environment variables or add them to your .env file."
+def count_rows_in_supabase(
+    table_name: str,
+    filters: Optional[Dict[str, Any]] = None,
+    ilike_filters: Optional[Dict[str, List[str]]] = None,
+) -> int:
+    """
+    Count the records matching the filters in OpenVC database without fetching them.
+
+    Args:
+        table_name (str): Name of the table to count records in
+        filters (Optional[Dict[str, Any]]): Dictionary of filters to apply (column: value)
+        ilike_filters (Optional[Dict[str, List[str]]]): Dictionary of case-insensitive substring filters (column: texts that must all appear)
+
+    Returns:
+        int: Number of matching records
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error connecting to Supabase or counting records
+    """
+    supabase = _get_client()
+
+    try:
+        query = _build_select_query(
+            supabase,
+            table_name,
+            filters=filters,
+            ilike_filters=ilike_filters,
+            count_only=True,
         )
+        response = query.execute()
+
+    except Exception as e:
+        raise Exception(f"Error counting data in Supabase: {str(e)}")
+
+    return response.count or 0
+
+
+def fetch_all_rows_from_supabase(
+    table_name: str,
+    select_columns: Optional[List[str]] = None,
+    page_size: int = 1000,
+    max_parallel_pages: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every record of a table, requesting several pages at once.
+
+    The table is counted first so every page range is known up front. The
+    pages are then requested concurrently over the shared HTTP/2 connection,
+    so waiting for one page overlaps with transferring and parsing the others.
+    Pages cut short by PostgREST's maximum row count are completed with
+    further requests, and rows added after the count are fetched at the end.
+
+    Args:
+        table_name (str): Name of the table to fetch data from
+        select_columns (Optional[List[str]]): List of columns to select. If None, selects all columns
+        page_size (int): Number of records to request per page
+        max_parallel_pages (int): Maximum number of pages requested at once
+
+    Returns:
+        List[Dict[str, Any]]: All records from the table, in page order
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error connecting to Supabase or fetching data,
+            or if rows were removed while the pages were fetched
+    """
+    supabase = _get_client()
+    total = count_rows_in_supabase(table_name)
+
+    def fetch_rows(start: int, end: int) -> List[Dict[str, Any]]:
+        # The server may return fewer rows than requested, so keep asking for
+        # the rest of the range until it is complete or a page comes back empty
+        rows: List[Dict[str, Any]] = []
+        while start + len(rows) < end:
+            try:
+                query = _build_select_query(supabase, table_name, select_columns)
+                page = query.range(start + len(rows), end - 1).execute().data
+
+            except Exception as e:
+                raise Exception(f"Error fetching data from Supabase: {str(e)}")
+
+            if not page:
+                break
+            rows.extend(page)
+
+        return rows
+
+    def fetch_page(start: int) -> List[Dict[str, Any]]:
+        end = min(start + page_size, total)
+        rows = fetch_rows(start, end)
+        if len(rows) < end - start:
+            raise Exception(
+                f"Error fetching data from Supabase: expected {total} rows in "
+                f"{table_name}, but rows {start + len(rows)}-{end - 1} are missing"
+            )
+        return rows
+
+    # A short-lived pool of its own: callers already run on _DB_EXECUTOR, and
+    # waiting there on tasks queued behind busy threads could deadlock
+    with ThreadPoolExecutor(
+        max_workers=max_parallel_pages, thread_name_prefix="supabase-page"
+    ) as pool:
+        pages = pool.map(fetch_page, range(0, total, page_size))
+        rows = [row for page in pages for row in page]
+
+    # Pick up rows added since the count
+    while True:
+        extra = fetch_rows(len(rows), len(rows) + page_size)
+        if not extra:
+            return rows
+        rows.extend(extra)
+
+
+def fetch_row_from_supabase(
+    table_name: str,
+    select_columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the first record matching the filters from OpenVC database.
+
+    Args:
+        table_name (str): Name of the table to fetch data from
+        select_columns (Optional[List[str]]): List of columns to select. If None, selects all columns
+        filters (Optional[Dict[str, Any]]): Dictionary of filters to apply (column: value)
+
+    Returns:
+        Optional[Dict[str, Any]]: The matching record, or None if there is none
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error connecting to Supabase or fetching data
+    """
+    supabase = _get_client()
 
     try:
-        # Create Supabase client
-        supabase: Client = create_client(supabase_url, supabase_key)
+        query = _build_select_query(supabase, table_name, select_columns, filters)
+        # Limit first so duplicate matches don't make maybe_single() fail
+        response = query.limit(1).maybe_single().execute()
 
-        # Build the query
-        if select_columns is None:
-            query = supabase.table(table_name).select("*")
-        else:
-            # Handle column names with spaces by wrapping them in quotes
-            quoted_columns = [f'"{col}"' for col in select_columns]
-            query = supabase.table(table_name).select(", ".join(quoted_columns))
-
-        # Apply filters if provided
-        if filters:
-            for column, value in filters.items():
-                # Handle column names with spaces by wrapping them in quotes
-                quoted_column = f'"{column}"'
-                query = query.eq(quoted_column, value)
-
-        # Apply limit if provided
-        if limit:
-            query = query.limit(limit)
+    except Exception as e:
+        raise Exception(f"Error fetching data from Supabase: {str(e)}")
 
-        # Execute the query
-        response = query.execute()
+    return response.data if response is not None else None
+
+
+def parse_amount(amount: Any) -> Optional[int]:
+    """
+    Parse an investment amount such as "100k", "$1.5M" or "2,000,000".
+
+    Args:
+        amount (Any): Amount as a string (with optional k/M/B suffix) or number
+
+    Returns:
+        Optional[int]: The amount in whole currency units, or None if it can't be parsed
+    """
+    if isinstance(amount, (int, float)):
+        return int(amount)
+    if not isinstance(amount, str):
+        return None
+
+    text = amount.strip().lower().replace(",", "").lstrip("$€£").strip()
+
+    multiplier = 1
+    if text and text[-1] in _AMOUNT_SUFFIXES:
+        multiplier = _AMOUNT_SUFFIXES[text[-1]]
+        text = text[:-1].strip()
+
+    try:
+        return int(float(text) * multiplier)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _thesis_preview(investor: Dict[str, Any]) -> str:
+    """
+    Get the beginning of an investor's thesis as shown in responses.
+
+    Records in the in-memory investor table carry the preview precomputed under
+    "_thesis_preview"; other records are shortened here.
+
+    Args:
+        investor (Dict[str, Any]): Investor record
+
+    Returns:
+        str: The first 100 characters of the thesis, "..." if it is longer, or
+        "N/A" if there is none
+    """
+    preview = investor.get("_thesis_preview")
+    if preview is None:
+        preview = investor.get("Investment thesis") or "N/A"
+        if len(preview) > 100:
+            preview = preview[:100] + "..."
+    return preview
+
+
+def _format_investor(
+    investor: Dict[str, Any],
+    rank: int,
+    score: Optional[int] = None,
+    factors: Optional[List[str]] = None,
+) -> str:
+    """
+    Format a single investor record for a tool response.
+
+    Args:
+        investor (Dict[str, Any]): Investor record
+        rank (int): Position of the record in the response
+        score (Optional[int]): Similarity score shown next to the name, if any
+        factors (Optional[List[str]]): Similarity factors shown before the
+            thesis, if any
+
+    Returns:
+        str: The formatted record, followed by a separator line
+    """
+    thesis = _thesis_preview(investor)
+    score_text = f" (Similarity Score: {score})" if score is not None else ""
+    factors_line = (
+        f"   Similarity Factors: {', '.join(factors)}\n" if factors is not None else ""
+    )
+
+    # A single f-string renders the whole record; it is compiled once with the
+    # module and is several times faster than string.Template or str.format
+    return (
+        f"{rank}. {investor.get('Investor name', 'N/A')}{score_text}\n"
+        f"   Website: {investor.get('Website', 'N/A')}\n"
+        f"   Global HQ: {investor.get('Global HQ', 'N/A')}\n"
+        f"   Countries: {investor.get('Countries of investment', 'N/A')}\n"
+        f"   Stage: {investor.get('Stage of investment', 'N/A')}\n"
+        f"   Type: {investor.get('Investor type', 'N/A')}\n"
+        f"   First Cheque: {investor.get('First cheque minimum', 'N/A')} - {investor.get('First cheque maximum', 'N/A')}\n"
+        f"{factors_line}"
+        f"   Thesis: {thesis}\n"
+        f"{_RECORD_SEPARATOR}"
+    )
+
+
+def _render_investor_list(
+    data: List[Dict[str, Any]],
+    header: str,
+    total: Optional[int] = None,
+) -> str:
+    """
+    Render a tool response listing investor records.
+
+    Args:
+        data (List[Dict[str, Any]]): Investor records to list
+        header (str): First line(s) of the response
+        total (Optional[int]): Total number of matching records, if more than
+            were fetched. Defaults to len(data)
+
+    Returns:
+        str: The header, the first 10 records and a note about any remaining ones
+    """
+    if total is None:
+        total = len(data)
+
+    parts = [header]
+    for i, investor in enumerate(data[:10], 1):  # Show top 10 by default
+        parts.append(_format_investor(investor, i))
+
+    if total > 10:
+        parts.append(f"... and {total - 10} more records.")
+
+    return "".join(parts)
+
+
+def _cached(key: str, fn: Callable[[], str], ttl: float = cache_ttl_seconds) -> str:
+    """
+    Return the cached response for key, recomputing it with fn once it expires.
+
+    The investor table is a dated snapshot, so read-only analysis results can be
+    reused for a while instead of re-fetching the whole table on every call.
+
+    Args:
+        key (str): Cache key identifying the response
+        fn (Callable[[], str]): Function that computes the response
+        ttl (float): Number of seconds a cached response stays valid
+
+    Returns:
+        str: The cached or freshly computed response
+    """
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+
+    value = fn()
+    _cache[key] = (time.monotonic(), value)
+    return value
+
+
+def _index_investors(rows: List[Dict[str, Any]]) -> _InvestorTable:
+    """
+    Index investor records by name and by the columns used to score similar investors.
+
+    Categorical values are interned so repeated values share one string and
+    compare by identity first. Cheque sizes and the type, stage and country
+    distributions and the thesis previews shown in responses are computed here
+    once per load rather than on every call.
+
+    Args:
+        rows (List[Dict[str, Any]]): Investor records
+
+    Returns:
+        _InvestorTable: The records, their indexes and aggregates
+    """
+    by_name = defaultdict(list)
+    by_type, by_stage, by_countries, by_hq = (defaultdict(set) for _ in range(4))
+    cheques = []
+    cheque_coverage = 0
+    for i, row in enumerate(rows):
+        for column in _CATEGORICAL_COLUMNS:
+            if isinstance(value := row.get(column), str):
+                row[column] = sys.intern(value)
+
+        row["_thesis_preview"] = _thesis_preview(row)
+
+        by_name[row.get("Investor name")].append(i)
+        by_type[row.get("Investor type")].add(i)
+        by_stage[row.get("Stage of investment")].add(i)
+        by_countries[row.get("Countries of investment")].add(i)
+        if hq := row.get("Global HQ"):
+            by_hq[hq].add(i)
+
+        min_cheque = parse_amount(row.get("First cheque minimum"))
+        max_cheque = parse_amount(row.get("First cheque maximum"))
+        if min_cheque is not None and max_cheque is not None:
+            cheques.append((min_cheque, max_cheque, row))
+
+        min_text = row.get("First cheque minimum")
+        max_text = row.get("First cheque maximum")
+        if min_text and max_text and min_text != "N/A" and max_text != "N/A":
+            cheque_coverage += 1
+
+    # Count from the indexes: one step per distinct value instead of per row
+    type_counts = Counter(
+        {
+            investor_type: len(ids)
+            for investor_type, ids in by_type.items()
+            if investor_type
+        }
+    )
+    stage_counts = Counter(
+        {stage: len(ids) for stage, ids in by_stage.items() if stage}
+    )
+    country_counts = Counter()
+    by_country = defaultdict(set)
+    for countries, ids in by_countries.items():
+        if countries:
+            for country in countries.split(","):
+                country = country.strip()
+                country_counts[country] += len(ids)
+                if country:
+                    by_country[country] |= ids
+
+    # Plain dicts so lookups of unknown values don't add empty entries
+    return _InvestorTable(
+        rows,
+        dict(by_name),
+        dict(by_type),
+        dict(by_stage),
+        dict(by_countries),
+        dict(by_hq),
+        dict(by_country),
+        {},
+        cheques,
+        type_counts,
+        stage_counts,
+        country_counts,
+        cheque_coverage,
+    )
+
+
+def _similar_hq_positions(investors: _InvestorTable, target_hq: str) -> set[int]:
+    """
+    Find the investors whose HQ contains any word of the target HQ.
+
+    Each distinct HQ is tested once, and the result is remembered for the
+    lifetime of the table since many investors share the same HQ.
+
+    Args:
+        investors (_InvestorTable): The in-memory investor table
+        target_hq (str): HQ of the investor to compare against
+
+    Returns:
+        set[int]: Positions in investors.rows of the matching investors
+    """
+    positions = investors.similar_hq.get(target_hq)
+    if positions is not None:
+        return positions
+
+    positions = set()
+    target_hq_words = target_hq.split()
+    if target_hq_words:
+        # One compiled alternation finds any of the words in a single scan of
+        # each HQ
+        target_hq_pattern = re.compile("|".join(map(re.escape, target_hq_words)))
+        for investor_hq, hq_positions in investors.by_hq.items():
+            if target_hq_pattern.search(investor_hq):
+                positions |= hq_positions
+
+    investors.similar_hq[target_hq] = positions
+    return positions
+
+
+def _similarity_score_groups() -> (
+    List[tuple[int, List[tuple[tuple[int, ...], tuple[int, ...]]]]]
+):
+    """
+    Group every combination of shared similarity factors by its score.
+
+    Returns:
+        List[tuple[int, List[tuple[tuple[int, ...], tuple[int, ...]]]]]: For
+        each score, highest first, the (shared, not shared) indexes into
+        _SIMILARITY_FACTORS of the combinations adding up to it
+    """
+    indexes = range(len(_SIMILARITY_FACTORS))
+    groups = defaultdict(list)
+    for size in range(1, len(_SIMILARITY_FACTORS) + 1):
+        for shared in itertools.combinations(indexes, size):
+            score = sum(_SIMILARITY_FACTORS[i][1] for i in shared)
+            not_shared = tuple(i for i in indexes if i not in shared)
+            groups[score].append((shared, not_shared))
+
+    return sorted(groups.items(), reverse=True)
+
+
+# Built once so ranking a target only runs the set operations
+_SIMILARITY_SCORE_GROUPS = _similarity_score_groups()
+
+
+def _rank_similar_investors(
+    matches: List[set[int]], exclude: set[int], count: int
+) -> tuple[List[tuple[int, int]], int]:
+    """
+    Rank investors by the weighted factors they share with a target investor.
+
+    Rather than scoring candidates one at a time in Python, the investors
+    sharing each combination of factors are found with set operations, which
+    run in C, starting from the highest score and stopping once count
+    investors are found.
+
+    Args:
+        matches (List[set[int]]): Positions of the investors sharing each of
+            _SIMILARITY_FACTORS with the target
+        exclude (set[int]): Positions to leave out, i.e. the target itself
+        count (int): Number of top investors to return
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: (score, position) of the top
+        investors, ordered by score and then table position, and the number
+        of investors sharing at least one factor
+    """
+    total = len(set().union(*matches) - exclude)
+
+    top = []
+    for score, combinations in _SIMILARITY_SCORE_GROUPS:
+        if len(top) >= count:
+            break
+
+        positions = set()
+        for shared, not_shared in combinations:
+            shared_matches = [matches[i] for i in shared]
+            group = min(shared_matches, key=len).intersection(*shared_matches)
+            group.difference_update(exclude, *(matches[i] for i in not_shared))
+            positions |= group
+
+        # Ties rank in table order
+        top.extend(
+            (score, position)
+            for position in heapq.nsmallest(count - len(top), positions)
+        )
+
+    return top, total
+
+
+def _load_all_investors() -> _InvestorTable:
+    """
+    Get every investor record, reloading the table once the cache TTL expires.
+
+    The list, search, similar investor and cheque size tools and the Python
+    fallbacks of the type, country, stage and statistics tools share this copy,
+    so after the first call they read memory instead of querying the table
+    again. Only one thread reloads it; the others wait for that load
+    instead of starting their own.
+
+    Returns:
+        _InvestorTable: All investor records with the list columns, and their indexes
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error connecting to Supabase or fetching data
+    """
+    global _investor_snapshot, _similar_reports_started
+
+    with _INVESTOR_SNAPSHOT_LOCK:
+        if (
+            _investor_snapshot is None
+            or time.monotonic() - _investor_snapshot[0] >= cache_ttl_seconds
+        ):
+            # Responses show at most 100 characters of the thesis, so the
+            # compact view is enough and keeps the largest column small
+            rows = fetch_all_rows_from_supabase(
+                table_name=compact_table_name,
+                select_columns=_INVESTOR_LIST_COLUMNS,
+            )
+            _investor_snapshot = (time.monotonic(), _index_investors(rows))
+            _build_similar_investors_report.cache_clear()
+            _similar_reports_started = _investor_snapshot[0]
+
+        return _investor_snapshot[1]
+
+
+def _search_investors(
+    filters: Dict[str, Any], hq_location: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Find the investors matching search filters in the in-memory table.
+
+    Equality filters are answered from the column indexes and the HQ text is
+    tested once per distinct HQ, so no row is compared one at a time.
+
+    Args:
+        filters (Dict[str, Any]): Exact values for the investor type, stage
+            and countries columns (column: value)
+        hq_location (Optional[str]): Case-insensitive text the Global HQ must contain
+
+    Returns:
+        List[Dict[str, Any]]: Matching investor records, in table order
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error connecting to Supabase or fetching data
+    """
+    investors = _load_all_investors()
+    indexes = {
+        "Investor type": investors.by_type,
+        "Stage of investment": investors.by_stage,
+        "Countries of investment": investors.by_countries,
+    }
+
+    matches = [indexes[column].get(value, set()) for column, value in filters.items()]
+    if hq_location:
+        hq_location = hq_location.lower()
+        matches.append(
+            set().union(
+                *(
+                    positions
+                    for hq, positions in investors.by_hq.items()
+                    if hq_location in hq.lower()
+                )
+            )
+        )
+
+    if not matches:
+        return investors.rows
 
-        # Return the data
+    positions = min(matches, key=len).intersection(*matches)
+    return [investors.rows[position] for position in sorted(positions)]
+
+
+def call_supabase_function(
+    function_name: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> Optional[Any]:
+    """
+    Call an optional Postgres function through Supabase RPC.
+
+    The functions are defined in sql/investor_functions.sql. If a function has
+    not been installed, it is remembered as unavailable and None is returned so
+    callers can fall back to computing the result in Python.
+
+    Args:
+        function_name (str): Name of the Postgres function to call
+        params (Optional[Dict[str, Any]]): Named arguments for the function
+
+    Returns:
+        Optional[Any]: Rows (or the JSON value) returned by the function, or None
+        if the function is not available
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+        Exception: If there's an error calling the function
+    """
+    if function_name in _UNAVAILABLE_FUNCTIONS:
+        return None
+
+    supabase = _get_client()
+
+    try:
+        response = supabase.rpc(function_name, params or {}).execute()
         return response.data
 
+    except APIError as e:
+        # PGRST202: function not found in the schema cache
+        if e.code == "PGRST202":
+            _UNAVAILABLE_FUNCTIONS.add(function_name)
+            return None
+        raise Exception(f"Error calling Supabase function {function_name}: {str(e)}")
+
     except Exception as e:
-        raise Exception(f"Error fetching data from Supabase: {str(e)}")
+        raise Exception(f"Error calling Supabase function {function_name}: {str(e)}")
 
 
 @mcp.tool()
@@ -103,50 +1070,20 @@ async def get_investor_data(limit: Optional[int] = None) -> str:
         - First cheque minimum and maximum
     """
     try:
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investor name",
-                "Website",
-                "Global HQ",
-                "Countries of investment",
-                "Stage of investment",
-                "Investment thesis",
-                "Investor type",
-                "First cheque minimum",
-                "First cheque maximum",
-            ],
-            limit=limit,
-        )
+        # Serve the records from the in-memory investor table
+        data = (await _run_blocking(_load_all_investors)).rows
+        total = len(data)
+        if limit:
+            data = data[:limit]
+            total = min(total, limit)
 
         if not data:
             return "No investor data found."
 
         # Format the data into a clean string for the LLM
-        formatted_response = f"Found {len(data)} investor records:\n\n"
-
-        for i, investor in enumerate(data[:10], 1):  # Show top 10 by default
-            formatted_response += f"{i}. {investor.get('Investor name', 'N/A')}\n"
-            formatted_response += f"   Website: {investor.get('Website', 'N/A')}\n"
-            formatted_response += f"   Global HQ: {investor.get('Global HQ', 'N/A')}\n"
-            formatted_response += (
-                f"   Countries: {investor.get('Countries of investment', 'N/A')}\n"
-            )
-            formatted_response += (
-                f"   Stage: {investor.get('Stage of investment', 'N/A')}\n"
-            )
-            formatted_response += f"   Type: {investor.get('Investor type', 'N/A')}\n"
-            formatted_response += f"   First Cheque: {investor.get('First cheque minimum', 'N/A')} - {investor.get('First cheque maximum', 'N/A')}\n"
-            thesis = investor.get("Investment thesis", "N/A")
-            if len(thesis) > 100:
-                thesis = thesis[:100] + "..."
-            formatted_response += f"   Thesis: {thesis}\n"
-            formatted_response += "-" * 80 + "\n\n"
-
-        if len(data) > 10:
-            formatted_response += f"... and {len(data) - 10} more records."
-
-        return formatted_response
+        return _render_investor_list(
+            data, f"Found {total} investor records:\n\n", total
+        )
 
     except Exception as e:
         return f"An error occurred while fetching investor data: {e}"
@@ -175,48 +1112,12 @@ async def search_investors_by_criteria(
         str: Formatted string containing matching investor records
     """
     try:
-        # Map common investor type names to database values
-        investor_type_mapping = {
-            "angel": "Angel network",
-            "angel network": "Angel network",
-            "vc": "VC",
-            "venture capital": "VC",
-            "pe": "PE",
-            "private equity": "PE",
-            "cvc": "CVC",
-            "corporate venture capital": "CVC",
-        }
-
-        # Map common country names to database values
-        country_mapping = {
-            "united states": "USA",
-            "usa": "USA",
-            "us": "USA",
-            "america": "USA",
-            "united kingdom": "UK",
-            "uk": "UK",
-            "england": "UK",
-            "great britain": "UK",
-            "germany": "Germany",
-            "france": "France",
-            "canada": "Canada",
-            "australia": "Australia",
-            "japan": "Japan",
-            "china": "China",
-            "india": "India",
-            "singapore": "Singapore",
-            "netherlands": "Netherlands",
-            "sweden": "Sweden",
-            "switzerland": "Switzerland",
-            "israel": "Israel",
-        }
-
         filters = {}
         if investor_type:
             # Convert to lowercase for case-insensitive matching
             investor_type_lower = investor_type.lower()
             # Use mapping if available, otherwise use original value
-            mapped_type = investor_type_mapping.get(investor_type_lower, investor_type)
+            mapped_type = _INVESTOR_TYPE_MAP.get(investor_type_lower, investor_type)
             filters["Investor type"] = mapped_type
         if stage:
             filters["Stage of investment"] = stage
@@ -224,29 +1125,17 @@ async def search_investors_by_criteria(
             # Convert to lowercase for case-insensitive matching
             country_lower = country.lower()
             # Use mapping if available, otherwise use original value
-            mapped_country = country_mapping.get(country_lower, country)
+            mapped_country = _COUNTRY_MAP.get(country_lower, country)
             filters["Countries of investment"] = mapped_country
-        if hq_location:
-            # For HQ location, we'll do a case-insensitive search
-            # This allows searching for cities, states, or countries in the address
-            filters["Global HQ"] = hq_location
 
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investor name",
-                "Website",
-                "Global HQ",
-                "Countries of investment",
-                "Stage of investment",
-                "Investment thesis",
-                "Investor type",
-                "First cheque minimum",
-                "First cheque maximum",
-            ],
-            filters=filters,
-            limit=limit,
-        )
+        # Filter the in-memory investor table. HQ location is a case-insensitive
+        # substring search, which allows searching for cities, states, or
+        # countries in the address.
+        data = await _run_blocking(_search_investors, filters, hq_location)
+        total = len(data)
+        if limit:
+            data = data[:limit]
+            total = min(total, limit)
 
         if not data:
             filter_desc = []
@@ -264,34 +1153,37 @@ async def search_investors_by_criteria(
             )
             return f"No investors found matching {filter_str}."
 
-        # Format the data
-        formatted_response = f"Found {len(data)} investors matching your criteria:\n\n"
+        # Format the response
+        return _render_investor_list(
+            data, f"Found {total} investors matching your criteria:\n\n", total
+        )
 
-        for i, investor in enumerate(data[:10], 1):  # Show top 10 by default
-            formatted_response += f"{i}. {investor.get('Investor name', 'N/A')}\n"
-            formatted_response += f"   Website: {investor.get('Website', 'N/A')}\n"
-            formatted_response += f"   Global HQ: {investor.get('Global HQ', 'N/A')}\n"
-            formatted_response += (
-                f"   Countries: {investor.get('Countries of investment', 'N/A')}\n"
-            )
-            formatted_response += (
-                f"   Stage: {investor.get('Stage of investment', 'N/A')}\n"
-            )
-            formatted_response += f"   Type: {investor.get('Investor type', 'N/A')}\n"
-            formatted_response += f"   First Cheque: {investor.get('First cheque minimum', 'N/A')} - {investor.get('First cheque maximum', 'N/A')}\n"
-            thesis = investor.get("Investment thesis", "N/A")
-            if len(thesis) > 100:
-                thesis = thesis[:100] + "..."
-            formatted_response += f"   Thesis: {thesis}\n"
-            formatted_response += "-" * 80 + "\n\n"
+    except Exception as e:
+        return f"An error occurred while searching investors: {e}"
 
-        if len(data) > 10:
-            formatted_response += f"... and {len(data) - 10} more records."
 
-        return formatted_response
+def _build_investor_types_report() -> str:
+    """Build the list of unique investor types."""
+    # Let Postgres compute the distinct values when the function is installed
+    rows = call_supabase_function(
+        "get_distinct_investor_types", {"p_table": table_name}
+    )
 
-    except Exception as e:
-        return f"An error occurred while searching investors: {e}"
+    if rows is not None:
+        investor_types = {row["investor_type"] for row in rows}
+    else:
+        investor_types = set(_load_all_investors().type_counts)
+
+    if not investor_types:
+        return "No investor types found in the database."
+
+    # Format the response
+    parts = ["Available investor types in the database:\n\n"]
+    for i, investor_type in enumerate(sorted(investor_types), 1):
+        parts.append(f"{i}. {investor_type}\n")
+
+    parts.append(f"\nTotal: {len(investor_types)} unique investor types")
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -304,36 +1196,34 @@ async def get_available_investor_types() -> str:
         str: List of all unique investor types in the database
     """
     try:
-        # Get all investor types from the database
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=["Investor type"],
-            limit=None,  # Get all records to find unique types
+        return await _run_blocking(
+            _cached, "investor_types", _build_investor_types_report
         )
 
-        if not data:
-            return "No investor data found."
+    except Exception as e:
+        return f"An error occurred while fetching investor types: {e}"
 
-        # Extract unique investor types
-        investor_types = set()
-        for record in data:
-            investor_type = record.get("Investor type")
-            if investor_type:
-                investor_types.add(investor_type)
 
-        if not investor_types:
-            return "No investor types found in the database."
+def _build_countries_report() -> str:
+    """Build the list of unique countries of investment."""
+    # Let Postgres split and dedupe the countries when the function is installed
+    rows = call_supabase_function("get_distinct_countries", {"p_table": table_name})
 
-        # Format the response
-        formatted_response = "Available investor types in the database:\n\n"
-        for i, investor_type in enumerate(sorted(investor_types), 1):
-            formatted_response += f"{i}. {investor_type}\n"
+    if rows is not None:
+        countries = {row["country"] for row in rows}
+    else:
+        countries = set(_load_all_investors().country_counts)
 
-        formatted_response += f"\nTotal: {len(investor_types)} unique investor types"
-        return formatted_response
+    if not countries:
+        return "No countries found in the database."
 
-    except Exception as e:
-        return f"An error occurred while fetching investor types: {e}"
+    # Format the response
+    parts = ["Available countries in the database:\n\n"]
+    for i, country in enumerate(sorted(countries), 1):
+        parts.append(f"{i}. {country}\n")
+
+    parts.append(f"\nTotal: {len(countries)} unique countries")
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -346,38 +1236,7 @@ async def get_available_countries() -> str:
         str: List of all unique countries in the database
     """
     try:
-        # Get all countries from the database
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=["Countries of investment"],
-            limit=None,  # Get all records to find unique countries
-        )
-
-        if not data:
-            return "No investor data found."
-
-        # Extract unique countries
-        countries = set()
-        for record in data:
-            country = record.get("Countries of investment")
-            if country:
-                # Handle cases where multiple countries might be comma-separated
-                if "," in country:
-                    for single_country in country.split(","):
-                        countries.add(single_country.strip())
-                else:
-                    countries.add(country.strip())
-
-        if not countries:
-            return "No countries found in the database."
-
-        # Format the response
-        formatted_response = "Available countries in the database:\n\n"
-        for i, country in enumerate(sorted(countries), 1):
-            formatted_response += f"{i}. {country}\n"
-
-        formatted_response += f"\nTotal: {len(countries)} unique countries"
-        return formatted_response
+        return await _run_blocking(_cached, "countries", _build_countries_report)
 
     except Exception as e:
         return f"An error occurred while fetching countries: {e}"
@@ -392,27 +1251,34 @@ async def get_location_search_guide() -> str:
     Returns:
         str: Explanation of location search options
     """
-    return """
-    Location Search Guide:
-    
-    There are two different ways to search for investors by location:
-    
-    1. COUNTRY OF INVESTMENT (country parameter):
-       - Uses country codes like "USA", "UK", "Germany"
-       - Shows where the investor makes investments
-       - Example: "Find VCs in USA" or "Angel investors in UK"
-    
-    2. GLOBAL HQ LOCATION (hq_location parameter):
-       - Uses full addresses like "San Francisco, CA" or "New York, NY"
-       - Shows where the investor's headquarters is located
-       - Example: "Investors headquartered in San Francisco" or "VCs in New York"
-    
-    Tips:
-    - Use "country" for broad geographic investment areas
-    - Use "hq_location" for specific city/state searches
-    - You can search for cities, states, or countries in HQ location
-    - Country searches are more precise, HQ searches are more flexible
-    """
+    return _LOCATION_GUIDE
+
+
+def _build_stage_analysis() -> str:
+    """Build the investment stage distribution report."""
+    # Let Postgres group and count the stages when the function is installed
+    rows = call_supabase_function("get_stage_counts", {"p_table": table_name})
+
+    if rows is not None:
+        stage_counts = Counter({row["stage"]: row["count"] for row in rows})
+    else:
+        stage_counts = _load_all_investors().stage_counts
+
+    if not stage_counts:
+        return "No investment stage data found."
+
+    parts = ["Investment Stage Analysis:\n\n"]
+    total_investors = sum(stage_counts.values())
+
+    # Sorted by count
+    for stage, count in stage_counts.most_common():
+        percentage = (count / total_investors) * 100
+        parts.append(f"• {stage}: {count} investors ({percentage:.1f}%)\n")
+
+    parts.append(f"\nTotal investors analyzed: {total_investors}")
+    parts.append(f"\nUnique investment stages: {len(stage_counts)}")
+
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -425,39 +1291,7 @@ async def analyze_investment_stages() -> str:
         str: Analysis of investment stages with statistics and insights
     """
     try:
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=["Stage of investment"],
-            limit=None,
-        )
-
-        if not data:
-            return "No investor data found."
-
-        # Count stages
-        stage_counts = {}
-        for record in data:
-            stage = record.get("Stage of investment")
-            if stage:
-                stage_counts[stage] = stage_counts.get(stage, 0) + 1
-
-        if not stage_counts:
-            return "No investment stage data found."
-
-        # Sort by count
-        sorted_stages = sorted(stage_counts.items(), key=lambda x: x[1], reverse=True)
-
-        formatted_response = "Investment Stage Analysis:\n\n"
-        total_investors = sum(stage_counts.values())
-
-        for stage, count in sorted_stages:
-            percentage = (count / total_investors) * 100
-            formatted_response += f"• {stage}: {count} investors ({percentage:.1f}%)\n"
-
-        formatted_response += f"\nTotal investors analyzed: {total_investors}"
-        formatted_response += f"\nUnique investment stages: {len(stage_counts)}"
-
-        return formatted_response
+        return await _run_blocking(_cached, "investment_stages", _build_stage_analysis)
 
     except Exception as e:
         return f"An error occurred while analyzing investment stages: {e}"
@@ -482,50 +1316,32 @@ async def find_investors_by_cheque_size(
         str: Formatted string containing matching investor records
     """
     try:
-        # Get all investors with cheque size data
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investor name",
-                "Website",
-                "Global HQ",
-                "Countries of investment",
-                "Stage of investment",
-                "Investment thesis",
-                "Investor type",
-                "First cheque minimum",
-                "First cheque maximum",
-            ],
-            limit=None,
-        )
+        # Parse the requested amounts once
+        min_value = parse_amount(min_amount) if min_amount else None
+        if min_amount and min_value is None:
+            return f'Could not understand minimum amount \'{min_amount}\'. Use values like "100k", "1M" or "10M".'
 
-        if not data:
+        max_value = parse_amount(max_amount) if max_amount else None
+        if max_amount and max_value is None:
+            return f'Could not understand maximum amount \'{max_amount}\'. Use values like "500k", "5M" or "50M".'
+
+        # Get all investors with cheque size data, already parsed
+        investors = await _run_blocking(_load_all_investors)
+
+        if not investors.rows:
             return "No investor data found."
 
         # Filter by cheque size if specified
         filtered_data = []
-        for investor in data:
-            min_cheque = investor.get("First cheque minimum")
-            max_cheque = investor.get("First cheque maximum")
-
-            # Skip if no cheque data
-            if not min_cheque or not max_cheque:
-                continue
-
+        for min_cheque, max_cheque, investor in investors.cheques:
             # Apply filters if specified
-            include_investor = True
-
-            if min_amount:
-                # Simple comparison - in a real implementation, you'd want to parse amounts
-                if min_cheque.lower() < min_amount.lower():
-                    include_investor = False
+            if min_value is not None and min_cheque < min_value:
+                continue
 
-            if max_amount and include_investor:
-                if max_cheque.lower() > max_amount.lower():
-                    include_investor = False
+            if max_value is not None and max_cheque > max_value:
+                continue
 
-            if include_investor:
-                filtered_data.append(investor)
+            filtered_data.append(investor)
 
         if not filtered_data:
             filter_desc = []
@@ -544,35 +1360,81 @@ async def find_investors_by_cheque_size(
             filtered_data = filtered_data[:limit]
 
         # Format the response
-        formatted_response = (
-            f"Found {len(filtered_data)} investors matching your criteria:\n\n"
+        return _render_investor_list(
+            filtered_data,
+            f"Found {len(filtered_data)} investors matching your criteria:\n\n",
         )
 
-        for i, investor in enumerate(filtered_data[:10], 1):  # Show top 10 by default
-            formatted_response += f"{i}. {investor.get('Investor name', 'N/A')}\n"
-            formatted_response += f"   Website: {investor.get('Website', 'N/A')}\n"
-            formatted_response += f"   Global HQ: {investor.get('Global HQ', 'N/A')}\n"
-            formatted_response += (
-                f"   Countries: {investor.get('Countries of investment', 'N/A')}\n"
+    except Exception as e:
+        return f"An error occurred while searching by cheque size: {e}"
+
+
+def _build_thesis_analysis() -> str:
+    """Build the investment thesis theme report."""
+    # Stream the full thesis text; the in-memory table may only hold the
+    # beginning of each thesis
+    data = iter_rows_from_supabase(
+        table_name=table_name,
+        select_columns=[
+            "Investment thesis",
+            "Investor type",
+            "Stage of investment",
+        ],
+    )
+
+    # Extract thesis data
+    thesis_data = []
+    for record in data:
+        thesis = record.get("Investment thesis")
+        investor_type = record.get("Investor type")
+        stage = record.get("Stage of investment")
+
+        if thesis and thesis != "N/A":
+            thesis_data.append(
+                {"thesis": thesis, "type": investor_type, "stage": stage}
             )
-            formatted_response += (
-                f"   Stage: {investor.get('Stage of investment', 'N/A')}\n"
+
+    if not thesis_data:
+        return "No investment thesis data found."
+
+    # Count each theme once per investor in a single regex pass over the thesis
+    keyword_counts = Counter()
+    for item in thesis_data:
+        keyword_counts.update(
+            dict.fromkeys(
+                (
+                    _THESIS_KEYWORD_THEMES[match.lower()]
+                    for match in _THESIS_PATTERN.findall(item["thesis"])
+                ),
+                1,
             )
-            formatted_response += f"   Type: {investor.get('Investor type', 'N/A')}\n"
-            formatted_response += f"   First Cheque: {investor.get('First cheque minimum', 'N/A')} - {investor.get('First cheque maximum', 'N/A')}\n"
-            thesis = investor.get("Investment thesis", "N/A")
-            if len(thesis) > 100:
-                thesis = thesis[:100] + "..."
-            formatted_response += f"   Thesis: {thesis}\n"
-            formatted_response += "-" * 80 + "\n\n"
+        )
 
-        if len(filtered_data) > 10:
-            formatted_response += f"... and {len(filtered_data) - 10} more records."
+    sorted_keywords = keyword_counts.most_common()
 
-        return formatted_response
+    parts = [
+        "Investment Thesis Analysis:\n\n",
+        f"Total investors with thesis data: {len(thesis_data)}\n\n",
+        "Most Common Investment Themes:\n",
+    ]
+    for keyword, count in sorted_keywords[:10]:  # Top 10
+        percentage = (count / len(thesis_data)) * 100
+        parts.append(f"• {keyword}: {count} investors ({percentage:.1f}%)\n")
 
-    except Exception as e:
-        return f"An error occurred while searching by cheque size: {e}"
+    # Analysis by investor type
+    type_thesis = {}
+    for item in thesis_data:
+        investor_type = item["type"]
+        if investor_type not in type_thesis:
+            type_thesis[investor_type] = []
+        type_thesis[investor_type].append(item["thesis"])
+
+    parts.append("\nThesis Analysis by Investor Type:\n")
+    for investor_type, theses in type_thesis.items():
+        if len(theses) > 5:  # Only show types with enough data
+            parts.append(f"• {investor_type}: {len(theses)} investors\n")
+
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -585,109 +1447,143 @@ async def analyze_investment_thesis() -> str:
         str: Analysis of investment thesis patterns and common themes
     """
     try:
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investment thesis",
-                "Investor type",
-                "Stage of investment",
-            ],
-            limit=None,
-        )
+        return await _run_blocking(_cached, "investment_thesis", _build_thesis_analysis)
 
-        if not data:
-            return "No investor data found."
+    except Exception as e:
+        return f"An error occurred while analyzing investment thesis: {e}"
 
-        # Extract thesis data
-        thesis_data = []
-        for record in data:
-            thesis = record.get("Investment thesis")
-            investor_type = record.get("Investor type")
-            stage = record.get("Stage of investment")
 
-            if thesis and thesis != "N/A":
-                thesis_data.append(
-                    {"thesis": thesis, "type": investor_type, "stage": stage}
-                )
+@mcp.tool()
+async def search_investors_by_thesis(
+    query: str,
+    limit: Optional[int] = None,
+) -> str:
+    """
+    Search investors whose investment thesis mentions the given words.
+    Use this tool when a user wants investors focused on a sector, technology or theme (e.g., "AI", "climate", "fintech").
+    Without the full-text search function installed, every word must appear in the thesis as a case-insensitive substring.
 
-        if not thesis_data:
-            return "No investment thesis data found."
-
-        # Analyze common themes (simplified analysis)
-        common_keywords = [
-            "AI",
-            "artificial intelligence",
-            "machine learning",
-            "ML",
-            "fintech",
-            "financial technology",
-            "healthtech",
-            "healthcare",
-            "SaaS",
-            "software",
-            "enterprise",
-            "B2B",
-            "B2C",
-            "ecommerce",
-            "marketplace",
-            "platform",
-            "mobile",
-            "biotech",
-            "biotechnology",
-            "clean energy",
-            "sustainability",
-            "cybersecurity",
-            "security",
-            "blockchain",
-            "crypto",
-            "edtech",
-            "education",
-            "real estate",
-            "proptech",
-        ]
+    Args:
+        query (str): Words to look for in the investment thesis
+        limit (Optional[int]): Maximum number of records to return
+
+    Returns:
+        str: Formatted string containing matching investor records
+    """
+    try:
+        # Only the first 10 matches are shown
+        shown = min(limit, 10) if limit else 10
+
+        # Use the full-text index when the function is installed
+        rows = await _run_blocking(
+            call_supabase_function,
+            "search_thesis",
+            {"p_table": table_name, "p_query": query, "p_limit": shown},
+        )
 
-        keyword_counts = {}
-        for keyword in common_keywords:
-            count = sum(
-                1 for item in thesis_data if keyword.lower() in item["thesis"].lower()
+        if rows is not None:
+            data = rows
+            # Every row carries the number of matches before the limit
+            total = rows[0]["total"] if rows else 0
+        elif not _THESIS_WORD_PATTERN.findall(query):
+            data, total = [], 0
+        else:
+            # Fall back to matching every word as a case-insensitive substring
+            # (unstemmed, in any order), fetching the shown matches and
+            # counting the rest
+            words = _THESIS_WORD_PATTERN.findall(query)
+            data, total = await asyncio.gather(
+                _run_blocking(
+                    fetch_data_from_supabase,
+                    table_name=table_name,
+                    select_columns=_INVESTOR_LIST_COLUMNS,
+                    ilike_filters={"Investment thesis": words},
+                    limit=shown,
+                ),
+                _run_blocking(
+                    count_rows_in_supabase,
+                    table_name=table_name,
+                    ilike_filters={"Investment thesis": words},
+                ),
             )
-            if count > 0:
-                keyword_counts[keyword] = count
 
-        # Sort by count
-        sorted_keywords = sorted(
-            keyword_counts.items(), key=lambda x: x[1], reverse=True
-        )
+        if limit:
+            total = min(total, limit)
+
+        if not data:
+            return f"No investors found with '{query}' in their investment thesis."
 
-        formatted_response = "Investment Thesis Analysis:\n\n"
-        formatted_response += (
-            f"Total investors with thesis data: {len(thesis_data)}\n\n"
+        # Format the response
+        return _render_investor_list(
+            data,
+            f"Found {total} investors with '{query}' in their investment thesis:\n\n",
+            total,
         )
 
-        formatted_response += "Most Common Investment Themes:\n"
-        for keyword, count in sorted_keywords[:10]:  # Top 10
-            percentage = (count / len(thesis_data)) * 100
-            formatted_response += (
-                f"• {keyword}: {count} investors ({percentage:.1f}%)\n"
-            )
+    except Exception as e:
+        return f"An error occurred while searching investment theses: {e}"
 
-        # Analysis by investor type
-        type_thesis = {}
-        for item in thesis_data:
-            investor_type = item["type"]
-            if investor_type not in type_thesis:
-                type_thesis[investor_type] = []
-            type_thesis[investor_type].append(item["thesis"])
 
-        formatted_response += f"\nThesis Analysis by Investor Type:\n"
-        for investor_type, theses in type_thesis.items():
-            if len(theses) > 5:  # Only show types with enough data
-                formatted_response += f"• {investor_type}: {len(theses)} investors\n"
+def _build_investor_statistics() -> str:
+    """Build the investor database statistics report."""
+    # Fetch every aggregate in one round trip when the function is installed
+    bundle = call_supabase_function(
+        "investor_statistics_bundle", {"p_table": table_name}
+    )
 
-        return formatted_response
+    if bundle is not None:
+        total_investors = bundle["total"]
+        if not total_investors:
+            return "No investor data found."
 
-    except Exception as e:
-        return f"An error occurred while analyzing investment thesis: {e}"
+        type_counts = Counter(bundle["types"])
+        stage_counts = Counter(bundle["stages"])
+        country_counts = Counter(bundle["countries"])
+        cheque_count = bundle["cheque_coverage"]
+    else:
+        investors = _load_all_investors()
+        total_investors = len(investors.rows)
+        type_counts = investors.type_counts
+        stage_counts = investors.stage_counts
+        country_counts = investors.country_counts
+        cheque_count = investors.cheque_coverage
+
+        if not total_investors:
+            return "No investor data found."
+
+    # Format response
+    parts = [
+        "Investor Database Statistics:\n\n",
+        f"Total Investors: {total_investors}\n\n",
+    ]
+
+    # Top investor types
+    parts.append("Top Investor Types:\n")
+    for investor_type, count in type_counts.most_common(5):
+        percentage = (count / total_investors) * 100
+        parts.append(f"• {investor_type}: {count} ({percentage:.1f}%)\n")
+
+    # Top investment stages
+    parts.append("\nTop Investment Stages:\n")
+    for stage, count in stage_counts.most_common(5):
+        percentage = (count / total_investors) * 100
+        parts.append(f"• {stage}: {count} ({percentage:.1f}%)\n")
+
+    # Top countries
+    parts.append("\nTop Investment Countries:\n")
+    for country, count in country_counts.most_common(5):
+        percentage = (count / total_investors) * 100
+        parts.append(f"• {country}: {count} ({percentage:.1f}%)\n")
+
+    # Cheque size info
+    if cheque_count:
+        parts.append("\nCheque Size Data:\n")
+        parts.append(f"• Investors with cheque data: {cheque_count}\n")
+        parts.append(
+            f"• Percentage with cheque data: {(cheque_count / total_investors) * 100:.1f}%\n"
+        )
+
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -700,102 +1596,129 @@ async def get_investor_statistics() -> str:
         str: Comprehensive statistics about the investor database
     """
     try:
-        data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investor name",
-                "Investor type",
-                "Stage of investment",
-                "Countries of investment",
-                "Global HQ",
-                "First cheque minimum",
-                "First cheque maximum",
-            ],
-            limit=None,
+        return await _run_blocking(
+            _cached, "investor_statistics", _build_investor_statistics
         )
 
-        if not data:
-            return "No investor data found."
+    except Exception as e:
+        return f"An error occurred while getting statistics: {e}"
 
-        # Calculate statistics
-        total_investors = len(data)
 
-        # Investor types
-        type_counts = {}
-        for record in data:
-            investor_type = record.get("Investor type")
-            if investor_type:
-                type_counts[investor_type] = type_counts.get(investor_type, 0) + 1
+# lru_cache rather than _cached: investor names come from clients, so the
+# number of cached responses has to stay bounded
+@functools.lru_cache(maxsize=512)
+def _build_similar_investors_report(
+    investor_name: str, limit: Optional[int], cache_started: float
+) -> str:
+    """
+    Build the similar investors response.
 
-        # Investment stages
-        stage_counts = {}
-        for record in data:
-            stage = record.get("Stage of investment")
-            if stage:
-                stage_counts[stage] = stage_counts.get(stage, 0) + 1
-
-        # Countries
-        country_counts = {}
-        for record in data:
-            countries = record.get("Countries of investment")
-            if countries:
-                if "," in countries:
-                    for country in countries.split(","):
-                        country = country.strip()
-                        country_counts[country] = country_counts.get(country, 0) + 1
-                else:
-                    country_counts[countries] = country_counts.get(countries, 0) + 1
-
-        # Cheque size analysis
-        cheque_data = []
-        for record in data:
-            min_cheque = record.get("First cheque minimum")
-            max_cheque = record.get("First cheque maximum")
-            if (
-                min_cheque
-                and max_cheque
-                and min_cheque != "N/A"
-                and max_cheque != "N/A"
-            ):
-                cheque_data.append((min_cheque, max_cheque))
-
-        # Format response
-        formatted_response = "Investor Database Statistics:\n\n"
-        formatted_response += f"Total Investors: {total_investors}\n\n"
-
-        # Top investor types
-        sorted_types = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)
-        formatted_response += "Top Investor Types:\n"
-        for investor_type, count in sorted_types[:5]:
-            percentage = (count / total_investors) * 100
-            formatted_response += f"• {investor_type}: {count} ({percentage:.1f}%)\n"
-
-        # Top investment stages
-        sorted_stages = sorted(stage_counts.items(), key=lambda x: x[1], reverse=True)
-        formatted_response += f"\nTop Investment Stages:\n"
-        for stage, count in sorted_stages[:5]:
-            percentage = (count / total_investors) * 100
-            formatted_response += f"• {stage}: {count} ({percentage:.1f}%)\n"
-
-        # Top countries
-        sorted_countries = sorted(
-            country_counts.items(), key=lambda x: x[1], reverse=True
+    Responses are cached per investor name, limit and cache_started, the time
+    the cached responses started. It changes whenever the in-memory investor
+    table reloads, and at the latest CACHE_TTL_SECONDS after it last changed,
+    so cached responses never outlive the data they were built from.
+    """
+    # Let Postgres score and rank candidates when the function is installed
+    rows = call_supabase_function(
+        "find_similar_investors",
+        {
+            "p_table": table_name,
+            "p_name": investor_name,
+            "p_limit": min(limit, 10) if limit else 10,
+        },
+    )
+
+    if rows is not None:
+        if not rows:
+            # Only now does a missing investor need telling apart from one
+            # without similar investors
+            target_investor = fetch_row_from_supabase(
+                table_name=table_name,
+                select_columns=["Investor name"],
+                filters={"Investor name": investor_name},
+            )
+            if target_investor is None:
+                return f"No investor found with name '{investor_name}'."
+            return f"No similar investors found for '{investor_name}'."
+
+        scored_investors = [
+            {"investor": row, "score": row["score"], "factors": row["factors"]}
+            for row in rows
+        ]
+
+        # Every row carries the number of matches before the limit
+        total_similar = rows[0]["total"]
+        if limit:
+            total_similar = min(total_similar, limit)
+    else:
+        investors = _load_all_investors()
+
+        target_positions = investors.by_name.get(investor_name)
+        if not target_positions:
+            return f"No investor found with name '{investor_name}'."
+
+        target_investor = investors.rows[target_positions[0]]
+        target_type = target_investor.get("Investor type")
+        target_stage = target_investor.get("Stage of investment")
+        target_countries = {
+            country.strip()
+            for country in (target_investor.get("Countries of investment") or "").split(
+                ","
+            )
+        }
+
+        # Look up the investors sharing each factor in the indexes instead
+        # of comparing every row
+        matches = [
+            investors.by_type.get(target_type, set()),
+            investors.by_stage.get(target_stage, set()),
+            # Investors listing any of the target's countries
+            set().union(
+                *(investors.by_country.get(country, ()) for country in target_countries)
+            ),
+            # Similar HQ location (simplified check)
+            _similar_hq_positions(investors, target_investor.get("Global HQ") or ""),
+        ]
+
+        # Only the shown investors need ranking; every investor named like
+        # the target is skipped
+        top_scores, total_similar = _rank_similar_investors(
+            matches, set(target_positions), min(limit, 10) if limit else 10
         )
-        formatted_response += f"\nTop Investment Countries:\n"
-        for country, count in sorted_countries[:5]:
-            percentage = (count / total_investors) * 100
-            formatted_response += f"• {country}: {count} ({percentage:.1f}%)\n"
 
-        # Cheque size info
-        if cheque_data:
-            formatted_response += f"\nCheque Size Data:\n"
-            formatted_response += f"• Investors with cheque data: {len(cheque_data)}\n"
-            formatted_response += f"• Percentage with cheque data: {(len(cheque_data) / total_investors) * 100:.1f}%\n"
+        if not total_similar:
+            return f"No similar investors found for '{investor_name}'."
 
-        return formatted_response
+        # Apply limit
+        if limit:
+            total_similar = min(total_similar, limit)
+
+        # Describe only the investors that are shown
+        scored_investors = [
+            {
+                "investor": investors.rows[position],
+                "score": score,
+                "factors": [
+                    factor
+                    for (factor, _), positions in zip(_SIMILARITY_FACTORS, matches)
+                    if position in positions
+                ],
+            }
+            for score, position in top_scores
+        ]
 
-    except Exception as e:
-        return f"An error occurred while getting statistics: {e}"
+    # Format response
+    parts = [f"Similar investors to '{investor_name}':\n\n"]
+
+    for i, item in enumerate(scored_investors[:10], 1):  # Show top 10
+        parts.append(
+            _format_investor(item["investor"], i, item["score"], item["factors"])
+        )
+
+    if total_similar > 10:
+        parts.append(f"... and {total_similar - 10} more similar investors.")
+
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -814,136 +1737,20 @@ async def find_similar_investors(
     Returns:
         str: Formatted string containing similar investor records
     """
-    try:
-        # First, find the target investor
-        target_data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investor name",
-                "Investor type",
-                "Stage of investment",
-                "Countries of investment",
-                "Global HQ",
-            ],
-            filters={"Investor name": investor_name},
-            limit=1,
-        )
+    global _similar_reports_started
 
-        if not target_data:
-            return f"No investor found with name '{investor_name}'."
-
-        target_investor = target_data[0]
-        target_type = target_investor.get("Investor type")
-        target_stage = target_investor.get("Stage of investment")
-        target_countries = target_investor.get("Countries of investment")
-
-        # Find similar investors
-        similar_data = fetch_data_from_supabase(
-            table_name=table_name,
-            select_columns=[
-                "Investor name",
-                "Website",
-                "Global HQ",
-                "Countries of investment",
-                "Stage of investment",
-                "Investment thesis",
-                "Investor type",
-                "First cheque minimum",
-                "First cheque maximum",
-            ],
-            limit=None,
+    try:
+        if time.monotonic() - _similar_reports_started >= cache_ttl_seconds:
+            _build_similar_investors_report.cache_clear()
+            _similar_reports_started = time.monotonic()
+
+        return await _run_blocking(
+            _build_similar_investors_report,
+            investor_name,
+            limit,
+            _similar_reports_started,
         )
 
-        if not similar_data:
-            return "No investor data found."
-
-        # Score and rank similar investors
-        scored_investors = []
-        for investor in similar_data:
-            if investor.get("Investor name") == investor_name:
-                continue  # Skip the target investor
-
-            score = 0
-            similarity_factors = []
-
-            # Same investor type
-            if investor.get("Investor type") == target_type:
-                score += 3
-                similarity_factors.append("same investor type")
-
-            # Same investment stage
-            if investor.get("Stage of investment") == target_stage:
-                score += 2
-                similarity_factors.append("same investment stage")
-
-            # Same countries
-            if investor.get("Countries of investment") == target_countries:
-                score += 2
-                similarity_factors.append("same investment countries")
-
-            # Similar HQ location (simplified check)
-            target_hq = target_investor.get("Global HQ", "")
-            investor_hq = investor.get("Global HQ", "")
-            if (
-                target_hq
-                and investor_hq
-                and any(word in investor_hq for word in target_hq.split())
-            ):
-                score += 1
-                similarity_factors.append("similar HQ location")
-
-            if score > 0:
-                scored_investors.append(
-                    {
-                        "investor": investor,
-                        "score": score,
-                        "factors": similarity_factors,
-                    }
-                )
-
-        # Sort by score
-        scored_investors.sort(key=lambda x: x["score"], reverse=True)
-
-        if not scored_investors:
-            return f"No similar investors found for '{investor_name}'."
-
-        # Apply limit
-        if limit:
-            scored_investors = scored_investors[:limit]
-
-        # Format response
-        formatted_response = f"Similar investors to '{investor_name}':\n\n"
-
-        for i, item in enumerate(scored_investors[:10], 1):  # Show top 10
-            investor = item["investor"]
-            score = item["score"]
-            factors = item["factors"]
-
-            formatted_response += f"{i}. {investor.get('Investor name', 'N/A')} (Similarity Score: {score})\n"
-            formatted_response += f"   Website: {investor.get('Website', 'N/A')}\n"
-            formatted_response += f"   Global HQ: {investor.get('Global HQ', 'N/A')}\n"
-            formatted_response += (
-                f"   Countries: {investor.get('Countries of investment', 'N/A')}\n"
-            )
-            formatted_response += (
-                f"   Stage: {investor.get('Stage of investment', 'N/A')}\n"
-            )
-            formatted_response += f"   Type: {investor.get('Investor type', 'N/A')}\n"
-            formatted_response += f"   First Cheque: {investor.get('First cheque minimum', 'N/A')} - {investor.get('First cheque maximum', 'N/A')}\n"
-            formatted_response += f"   Similarity Factors: {', '.join(factors)}\n"
-            thesis = investor.get("Investment thesis", "N/A")
-            if len(thesis) > 100:
-                thesis = thesis[:100] + "..."
-            formatted_response += f"   Thesis: {thesis}\n"
-            formatted_response += "-" * 80 + "\n\n"
-
-        if len(scored_investors) > 10:
-            formatted_response += (
-                f"... and {len(scored_investors) - 10} more similar investors."
-            )
-
-        return formatted_response
-
     except Exception as e:
         return f"An error occurred while finding similar investors: {e}"
 
@@ -1002,10 +1809,24 @@ def analyze_investor_data(investor_data: str) -> str:
     """
 
 
+# ASGI app serving the MCP endpoint, importable as "server:app"
+app = mcp.streamable_http_app()
+
+
 if __name__ == "__main__":
     # Use streamable HTTP transport with MCP endpoint
     print(f"VC Data Server running on http://localhost:{port}")
     print("MCP endpoint available at:")
     print(f"- http://localhost:{port}/mcp")
 
-    mcp.run(transport="streamable-http")
+    # Multiple worker processes need the app as an import string. uvloop and
+    # httptools are picked up automatically when installed.
+    uvicorn.run(
+        "server:app" if workers > 1 else app,
+        host=mcp.settings.host,
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        log_level=mcp.settings.log_level.lower(),
+    )
@@ -0,0 +1,233 @@
+-- Optional Postgres functions used by the VC Data Server.
+--
+-- Run this once in the Supabase SQL editor. Every function takes the investor
+-- table name as its first argument so it works with any TABLE_NAME. When a
+-- function is missing, the server falls back to fetching rows and computing
+-- the same result in Python.
+
+
+-- Distinct investor types
+create or replace function get_distinct_investor_types(p_table text)
+returns table (investor_type text)
+language plpgsql stable
+as $$
+begin
+  return query execute format(
+    'select distinct "Investor type"::text
+       from %I
+      where coalesce("Investor type", '''') <> ''''
+      order by 1',
+    p_table
+  );
+end;
+$$;
+
+
+-- Distinct countries, splitting comma-separated lists
+create or replace function get_distinct_countries(p_table text)
+returns table (country text)
+language plpgsql stable
+as $$
+begin
+  return query execute format(
+    'select distinct trim(c)
+       from %I, unnest(string_to_array("Countries of investment", '','')) as c
+      where trim(c) <> ''''
+      order by 1',
+    p_table
+  );
+end;
+$$;
+
+
+-- Investor counts per investment stage
+create or replace function get_stage_counts(p_table text)
+returns table (stage text, count bigint)
+language plpgsql stable
+as $$
+begin
+  return query execute format(
+    'select "Stage of investment"::text, count(*)
+       from %I
+      where coalesce("Stage of investment", '''') <> ''''
+      group by 1',
+    p_table
+  );
+end;
+$$;
+
+
+
+-- All aggregates for the statistics tool in one round trip
+create or replace function investor_statistics_bundle(p_table text)
+returns jsonb
+language plpgsql stable
+as $$
+declare
+  result jsonb;
+begin
+  execute format(
+    'select jsonb_build_object(
+       ''total'', (select count(*) from %1$I),
+       ''types'', (
+         select coalesce(jsonb_object_agg(value, n), ''{}''::jsonb)
+           from (select "Investor type"::text as value, count(*) as n
+                   from %1$I
+                  where coalesce("Investor type", '''') <> ''''
+                  group by 1) s
+       ),
+       ''stages'', (
+         select coalesce(jsonb_object_agg(value, n), ''{}''::jsonb)
+           from (select "Stage of investment"::text as value, count(*) as n
+                   from %1$I
+                  where coalesce("Stage of investment", '''') <> ''''
+                  group by 1) s
+       ),
+       ''countries'', (
+         select coalesce(jsonb_object_agg(value, n), ''{}''::jsonb)
+           from (select trim(c) as value, count(*) as n
+                   from %1$I, unnest(string_to_array("Countries of investment", '','')) as c
+                  where trim(c) <> ''''
+                  group by 1) s
+       ),
+       ''cheque_coverage'', (
+         select count(*)
+           from %1$I
+          where coalesce("First cheque minimum"::text, '''') not in ('''', ''N/A'')
+            and coalesce("First cheque maximum"::text, '''') not in ('''', ''N/A'')
+       )
+     )',
+    p_table
+  ) into result;
+
+  return result;
+end;
+$$;
+
+
+-- Investors similar to p_name, scored and ranked in the database.
+-- Each row is the investor record (without the thesis_tsv search vector) plus
+-- its score, the matching factors and the total number of similar investors
+-- before p_limit is applied.
+-- Missing types and stages match like in the Python fallback, and ties are
+-- broken in its table order.
+create or replace function find_similar_investors(
+  p_table text,
+  p_name text,
+  p_limit int default 10
+)
+returns setof jsonb
+language plpgsql stable
+as $$
+begin
+  return query execute format(
+    'with target as (
+       select "Investor type" as t_type,
+              "Stage of investment" as t_stage,
+              "Countries of investment" as t_countries,
+              coalesce("Global HQ", '''') as t_hq
+         from %1$I
+        where "Investor name" = $1
+        limit 1
+     )
+     select (to_jsonb(c) - ''thesis_tsv'') || jsonb_build_object(
+              ''score'', m.score,
+              ''factors'', to_jsonb(m.factors),
+              ''total'', count(*) over ()
+            )
+       from %1$I c
+      cross join target t
+      cross join lateral (
+        select c."Investor type" is not distinct from t.t_type as same_type,
+               c."Stage of investment" is not distinct from t.t_stage as same_stage,
+               exists (
+                 select 1
+                   from unnest(string_to_array(c."Countries of investment", '','')) as a,
+                        unnest(string_to_array(t.t_countries, '','')) as b
+                  where trim(a) <> '''' and trim(a) = trim(b)
+               ) as shared_countries,
+               coalesce(c."Global HQ", '''') <> '''' and exists (
+                 select 1
+                   from unnest(string_to_array(t.t_hq, '' '')) as w
+                  where w <> '''' and strpos(c."Global HQ", w) > 0
+               ) as similar_hq
+      ) f
+      cross join lateral (
+        select (case when f.same_type then 3 else 0 end)
+             + (case when f.same_stage then 2 else 0 end)
+             + (case when f.shared_countries then 2 else 0 end)
+             + (case when f.similar_hq then 1 else 0 end) as score,
+               array_remove(array[
+                 case when f.same_type then ''same investor type'' end,
+                 case when f.same_stage then ''same investment stage'' end,
+                 case when f.shared_countries then ''shared investment countries'' end,
+                 case when f.similar_hq then ''similar HQ location'' end
+               ], null) as factors
+      ) m
+      where c."Investor name" <> $1
+        and m.score > 0
+      order by m.score desc, c."Investor name", c."Website", c."Global HQ"
+      limit $2',
+    p_table
+  ) using p_name, p_limit;
+end;
+$$;
+
+
+-- B-tree index for the investor lookups by name: the target investor in
+-- find_similar_investors and the single-row fetches. Replace "dec-2024" with
+-- your table name.
+create index if not exists investors_name_idx
+  on "dec-2024" ("Investor name");
+
+
+-- Full-text search over the investment thesis for search_investors_by_thesis.
+-- Each row is the investor record plus the total number of matches before
+-- p_limit is applied, best matches first. Needs the thesis_tsv column below.
+create or replace function search_thesis(
+  p_table text,
+  p_query text,
+  p_limit int default 10
+)
+returns setof jsonb
+language plpgsql stable
+as $$
+begin
+  return query execute format(
+    'select (to_jsonb(c) - ''thesis_tsv'') || jsonb_build_object(
+              ''total'', count(*) over ()
+            )
+       from %I c, plainto_tsquery(''english'', $1) as q
+      where c.thesis_tsv @@ q
+      order by ts_rank(c.thesis_tsv, q) desc
+      limit $2',
+    p_table
+  ) using p_query, p_limit;
+end;
+$$;
+
+
+-- Precomputed thesis search vector with a GIN index, used by search_thesis.
+-- Replace "dec-2024" with your table name.
+alter table "dec-2024"
+  add column if not exists thesis_tsv tsvector
+  generated always as (to_tsvector('english', coalesce("Investment thesis", ''))) stored;
+
+create index if not exists investors_thesis_tsv_idx
+  on "dec-2024" using gin (thesis_tsv);
+
+
+-- Compact view for the list tools: responses show at most 100 characters of
+-- the thesis, so only the first 120 are sent. Replace "dec-2024" with your
+-- table name and set COMPACT_TABLE_NAME to the view name.
+create or replace view "dec-2024_compact" as
+select "Investor name",
+       "Website",
+       "Global HQ",
+       "Countries of investment",
+       "Stage of investment",
+       left("Investment thesis", 120) as "Investment thesis",
+       "Investor type",
+       "First cheque minimum",
+       "First cheque maximum"
+  from "dec-2024";